@@ -35,6 +35,22 @@ def json_to_python(text: str) -> Optional[Document]:
         print(f"Warning: JSON parse error: {e}", file=sys.stderr)
         return None
 
+    return json_to_python_from_dict(data)
+
+
+def json_to_python_from_dict(data: dict) -> Optional[Document]:
+    """
+    Build a diagram_models Document from already-parsed AST JSON.
+
+    For callers that hold the parsed dict and would otherwise serialize it
+    back to text just to call json_to_python. The dict is not modified.
+
+    Args:
+        data: Parsed JSON conforming to schema/schema.graphql
+
+    Returns:
+        A Document object, or None if parsing fails.
+    """
     diagram_data = data.get("diagram", {})
     kind = diagram_data.get("kind")
 
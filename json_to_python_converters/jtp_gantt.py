@@ -38,7 +38,7 @@ def _parse_start(data: dict):
         return TimeOfDay(data["value"])
     if kind == "CONSTRAINT_REF":
         return ConstraintRef(
-            task_ids=data["task_ids"],
+            task_ids=list(data["task_ids"]),
             dependency_type=DependencyType(data["dependency_type"]),
             combination=DependencyCombination(data["combination"]),
             lag=data.get("lag"),
@@ -58,7 +58,7 @@ def _parse_end(data: dict):
         return TimeOfDay(data["value"])
     if kind == "CONSTRAINT_REF":
         return ConstraintRef(
-            task_ids=data["task_ids"],
+            task_ids=list(data["task_ids"]),
             dependency_type=DependencyType(data["dependency_type"]),
             combination=DependencyCombination(data["combination"]),
             lag=data.get("lag"),
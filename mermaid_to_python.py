@@ -2,50 +2,56 @@
 Convert Mermaid diagram text to diagram_models Python objects.
 """
 
-import sys
+import logging
+import re
 from typing import Optional
 
 from diagram_models import Document
 from mermaid_to_python_converters.mtp_gantt import parse_gantt
 
+logger = logging.getLogger(__name__)
 
 # Maps diagram type keywords to their parser functions.
 _PARSERS = {
     "gantt": parse_gantt,
 }
 
+# Skips leading blank lines and %% comment lines, then captures the first
+# token of the declaration line.  Only the head of the text is ever read.
+_FIRST_TOKEN_RE = re.compile(r"\s*(?:%%[^\n]*(?:\n\s*|$))*(?!%%)(\S+)")
 
-def _extract_frontmatter(text: str) -> tuple[Optional[str], str]:
+
+def _extract_frontmatter(text: str) -> tuple[Optional[str], str, list[str]]:
     """
     Strip YAML frontmatter from the start of the text.
 
-    Returns (content_between_delimiters, remaining_text).
-    Returns (None, original_text) if no frontmatter is present.
+    Returns (content_between_delimiters, remaining_text, remaining_lines).
+    Returns (None, original_text, original_lines) if no frontmatter is present.
+    remaining_lines is remaining_text split on "\\n", handed to the parser so
+    the body is only split once.
     """
     lines = text.split("\n")
     first_idx = next((i for i, l in enumerate(lines) if l.strip()), None)
     if first_idx is None or lines[first_idx].strip() != "---":
-        return None, text
+        return None, text, lines
 
     close_idx = next(
         (i for i in range(first_idx + 1, len(lines)) if lines[i].strip() == "---"),
         None,
     )
     if close_idx is None:
-        return None, text
+        return None, text, lines
 
-    content = "\n".join(lines[first_idx + 1 : close_idx]).strip()
-    remaining = "\n".join(lines[:first_idx] + lines[close_idx + 1 :])
-    return content, remaining
+    # Drop a CRLF file's '\r' here too, as the body parsers do per line.
+    content = "\n".join(l.rstrip("\r") for l in lines[first_idx + 1 : close_idx]).strip()
+    remaining_lines = lines[:first_idx] + lines[close_idx + 1 :]
+    return content, "\n".join(remaining_lines), remaining_lines
 
 
 def _detect_diagram_type(text: str) -> Optional[str]:
     """Return the diagram type keyword from the first content line."""
-    for line in text.split("\n"):
-        line = line.strip()
-        if line and not line.startswith("%%"):
-            return line.split()[0].lower()
-    return None
+    m = _FIRST_TOKEN_RE.match(text)
+    return m.group(1).lower() if m else None
 
 
 def mermaid_to_python(text: str) -> Optional[Document]:
@@ -58,18 +64,20 @@ def mermaid_to_python(text: str) -> Optional[Document]:
     Returns:
         A Document object, or None if the diagram type is unsupported.
     """
-    frontmatter, body = _extract_frontmatter(text)
+    frontmatter, body, body_lines = _extract_frontmatter(text)
 
     diagram_type = _detect_diagram_type(body)
     parser = _PARSERS.get(diagram_type)
 
     if parser is None:
-        print(f"Warning: Unknown or unsupported diagram type '{diagram_type}'", file=sys.stderr)
+        logger.warning("Warning: Unknown or unsupported diagram type %r", diagram_type)
         return None
 
     try:
-        diagram = parser(body)
+        diagram = parser(body, lines=body_lines)
         return Document(diagram=diagram, frontmatter=frontmatter, version="1.0")
-    except Exception as e:
-        print(f"Warning: Error parsing {diagram_type} diagram: {e}", file=sys.stderr)
+    except (re.error, ValueError, KeyError, AttributeError, IndexError) as e:
+        # Malformed diagram text surfaces as one of these; anything else is a
+        # parser bug and should propagate rather than be reported as bad input.
+        logger.warning("Warning: Error parsing %s diagram: %s", diagram_type, e)
         return None
@@ -44,12 +44,35 @@ _KEYWORD_TO_DIRECTIVE = {
     "weekend":      GanttDirectiveName.WEEKEND,
 }
 
-_STATUS_KEYWORDS      = {"done", "active", "crit"}
-_ELEMENT_TYPE_KEYWORDS = {"milestone", "vert"}
+# One anchored pattern for every directive keyword, so a preamble line is
+# matched (or rejected) in a single pass instead of once per keyword.
+# (?a:...) keeps the keyword match ASCII so group 1 always lowercases to a key.
+_DIRECTIVE_RE = re.compile(
+    rf"(?a:({'|'.join(_KEYWORD_TO_DIRECTIVE)}))\s+(.+)", re.IGNORECASE
+)
+_SECTION_RE = re.compile(r"section\s+(.+)", re.IGNORECASE)
+
+_DECLARATION = "gantt"
+
+# Leading task keywords, mapped straight to their enum members so each
+# metadata part costs a single dict lookup.
+_TASK_KEYWORDS = {
+    "done":      GanttTaskStatus.DONE,
+    "active":    GanttTaskStatus.ACTIVE,
+    "crit":      GanttTaskStatus.CRIT,
+    "milestone": GanttElementType.MILESTONE,
+    "vert":      GanttElementType.VERT,
+}
 
-_DUR_RE      = re.compile(r"^\d+[smhdw]$", re.IGNORECASE)
+# Durations are ASCII-only (a Unicode digit would leak into the ISO string),
+# so re.ASCII keeps \d to [0-9] and skips the Unicode class tables.
+_DUR_RE      = re.compile(r"^(\d+)([smhdw])$", re.IGNORECASE | re.ASCII)
 _TASK_REF_RE = re.compile(r"^(after|until)\s+(.+)", re.IGNORECASE)
 
+# Splits task metadata on commas and drops the surrounding whitespace in
+# the same scan.
+_COMMA_SPLIT_RE = re.compile(r"\s*,\s*")
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # day.js format → Python strptime
@@ -95,22 +118,18 @@ def _is_duration(s: str) -> bool:
     return bool(_DUR_RE.match(s))
 
 
-def _is_task_ref(s: str) -> bool:
-    return bool(_TASK_REF_RE.match(s))
-
-
 # ─────────────────────────────────────────────────────────────────────────────
 # Value conversion helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
 def _mermaid_dur_to_iso(s: str) -> str:
     """Convert a Mermaid duration shorthand (30d, 24h, 2m …) to ISO 8601."""
-    m = re.match(r"^(\d+)([smhdw])$", s, re.IGNORECASE)
+    m = _DUR_RE.match(s)
     if not m:
         raise ValueError(f"Cannot parse Mermaid duration: {s!r}")
-    n, unit = m.group(1), m.group(2).lower()
+    n, unit = m.groups()
     return {"w": f"P{n}W", "d": f"P{n}D", "h": f"PT{n}H",
-            "m": f"PT{n}M", "s": f"PT{n}S"}[unit]
+            "m": f"PT{n}M", "s": f"PT{n}S"}[unit.lower()]
 
 
 def _mermaid_date_to_iso(s: str, strptime_fmt: Optional[str], is_time: bool) -> str:
@@ -150,41 +169,41 @@ def _parse_task_line(
 
     name, _, rest = line.partition(":")
     name = name.strip()
-    parts = [p.strip() for p in rest.split(",")]
+    parts = _COMMA_SPLIT_RE.split(rest.strip())
 
-    # ── First pass: consume leading element-type and status keywords ──────────
     element_type = GanttElementType.TASK
     statuses: list[GanttTaskStatus] = []
-    start_idx = len(parts)
-
-    for i, part in enumerate(parts):
-        lower = part.lower()
-        if lower in _ELEMENT_TYPE_KEYWORDS:
-            element_type = GanttElementType[lower.upper()]
-        elif lower in _STATUS_KEYWORDS:
-            statuses.append(GanttTaskStatus[lower.upper()])
-        else:
-            start_idx = i
-            break
-
-    # ── Second pass: classify remaining parts ─────────────────────────────────
     task_id = None
     raw_start = None   # ("date", str) | ("after", [str])
     raw_end   = None   # ("date", str) | ("until", [str])
     raw_dur   = None   # str (Mermaid shorthand)
+    in_keywords = True  # element-type / status keywords only valid as a prefix
+
+    for part in parts:
+        # ── Leading element-type and status keywords ──────────────────────────
+        if in_keywords:
+            keyword = _TASK_KEYWORDS.get(part.lower())
+            if isinstance(keyword, GanttElementType):
+                element_type = keyword
+                continue
+            if keyword is not None:
+                statuses.append(keyword)
+                continue
+            in_keywords = False
 
-    for part in parts[start_idx:]:
+        # ── Metadata: id, start, end, duration ────────────────────────────────
         if not part:
             continue
 
         if _is_duration(part):
             raw_dur = part
+            continue
 
-        elif _is_task_ref(part):
-            m = _TASK_REF_RE.match(part)
-            verb = m.group(1).lower()
-            ids  = m.group(2).strip().split()
-            if verb == "after":
+        ref = _TASK_REF_RE.match(part)
+        if ref:
+            verb, refs = ref.groups()
+            ids = refs.strip().split()
+            if verb.lower() == "after":
                 raw_start = ("after", ids)
             else:
                 raw_end = ("until", ids)
@@ -240,29 +259,32 @@ def _parse_task_line(
 # Top-level parser
 # ─────────────────────────────────────────────────────────────────────────────
 
-def parse_gantt(text: str) -> GanttDiagram:
+def parse_gantt(text: str, lines: Optional[list[str]] = None) -> GanttDiagram:
     """
     Parse Mermaid gantt text (frontmatter already stripped) into a GanttDiagram.
 
     Directives and preamble comments go into diagram.header in source order.
     Sections, sectionless tasks, and body comments go into diagram.elements.
+
+    lines may carry text already split on "\\n" by the caller, in which case
+    the text is not split again.
     """
     diagram = GanttDiagram()
     current_section: Optional[GanttSection] = None
     in_body = False          # True once we've seen the first section or task
+    declared = False         # True once the first non-comment line is consumed
     strptime_fmt: Optional[str] = None
     is_time = False
 
-    for raw_line in text.split("\n"):
+    if lines is None:
+        lines = text.split("\n")
+
+    for raw_line in lines:
         line = raw_line.strip()
 
         if not line:
             continue
 
-        # "gantt" declaration line
-        if line.lower() == "gantt":
-            continue
-
         # Stand-alone comment  (%% text)
         if line.startswith("%%"):
             node = Comment(text=line[2:].strip())
@@ -273,8 +295,14 @@ def parse_gantt(text: str) -> GanttDiagram:
                 diagram.header.append(node)
             continue
 
+        # "gantt" declaration line — only the first non-comment line can be it
+        if not declared:
+            declared = True
+            if line.lower() == _DECLARATION:
+                continue
+
         # Section header
-        m = re.match(r"section\s+(.+)", line, re.IGNORECASE)
+        m = _SECTION_RE.match(line)
         if m:
             in_body = True
             current_section = GanttSection(name=m.group(1).strip())
@@ -283,18 +311,15 @@ def parse_gantt(text: str) -> GanttDiagram:
 
         # Directive (only recognised before the body begins)
         if not in_body:
-            matched = False
-            for keyword, directive_name in _KEYWORD_TO_DIRECTIVE.items():
-                m = re.match(rf"{keyword}\s+(.+)", line, re.IGNORECASE)
-                if m:
-                    value = m.group(1).strip()
-                    diagram.header.append(GanttDirective(name=directive_name, value=value))
-                    if directive_name == GanttDirectiveName.DATE_FORMAT:
-                        strptime_fmt = _dayjs_to_strptime(value)
-                        is_time = _is_time_format(value)
-                    matched = True
-                    break
-            if matched:
+            m = _DIRECTIVE_RE.match(line)
+            if m:
+                keyword, value = m.groups()
+                directive_name = _KEYWORD_TO_DIRECTIVE[keyword.lower()]
+                value = value.strip()
+                diagram.header.append(GanttDirective(name=directive_name, value=value))
+                if directive_name == GanttDirectiveName.DATE_FORMAT:
+                    strptime_fmt = _dayjs_to_strptime(value)
+                    is_time = _is_time_format(value)
                 continue
 
         # Task line (must contain a colon)
@@ -19,16 +19,15 @@ _RENDERERS = {
 }
 
 
-def python_to_json(doc: Document, indent: int = 2) -> Optional[str]:
+def python_to_json_dict(doc: Document) -> Optional[dict]:
     """
-    Convert a diagram_models Document to AST JSON text.
+    Convert a diagram_models Document to the AST as plain JSON-ready data.
 
     Args:
-        doc:    A Document object
-        indent: JSON indentation level (default 2)
+        doc: A Document object
 
     Returns:
-        JSON string conforming to schema/schema.graphql, or None if conversion fails.
+        dict conforming to schema/schema.graphql, or None if conversion fails.
     """
     renderer = _RENDERERS.get(type(doc.diagram))
     if renderer is None:
@@ -54,6 +53,28 @@ def python_to_json(doc: Document, indent: int = 2) -> Optional[str]:
                 "version": gp.version,
                 "working_days": [d.value for d in gp.working_days],
             }
+        return result
+    except Exception as e:
+        print(f"Warning: Error rendering diagram: {e}", file=sys.stderr)
+        return None
+
+
+def python_to_json(doc: Document, indent: int = 2) -> Optional[str]:
+    """
+    Convert a diagram_models Document to AST JSON text.
+
+    Args:
+        doc:    A Document object
+        indent: JSON indentation level (default 2)
+
+    Returns:
+        JSON string conforming to schema/schema.graphql, or None if conversion fails.
+    """
+    result = python_to_json_dict(doc)
+    if result is None:
+        return None
+
+    try:
         return json.dumps(result, indent=indent)
     except Exception as e:
         print(f"Warning: Error rendering diagram: {e}", file=sys.stderr)
@@ -76,11 +76,11 @@ def _format_date_value(iso_str: str, date_format: str) -> str:
 # ─────────────────────────────────────────────────────────────────────────────
 
 _DUR_PATTERNS = [
-    (re.compile(r"^P(\d+)W$"),  "{0}w"),
-    (re.compile(r"^P(\d+)D$"),  "{0}d"),
-    (re.compile(r"^PT(\d+)H$"), "{0}h"),
-    (re.compile(r"^PT(\d+)M$"), "{0}m"),
-    (re.compile(r"^PT(\d+)S$"), "{0}s"),
+    (re.compile(r"^P(\d+)W$", re.ASCII),  "{0}w"),
+    (re.compile(r"^P(\d+)D$", re.ASCII),  "{0}d"),
+    (re.compile(r"^PT(\d+)H$", re.ASCII), "{0}h"),
+    (re.compile(r"^PT(\d+)M$", re.ASCII), "{0}m"),
+    (re.compile(r"^PT(\d+)S$", re.ASCII), "{0}s"),
 ]
 
 
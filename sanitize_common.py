@@ -9,11 +9,17 @@ then delegates all argument parsing, file handling, and output writing here.
 
 import argparse
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 
-def make_arg_parser(description: str, epilog: str) -> argparse.ArgumentParser:
+def make_arg_parser(
+    description: str,
+    epilog: str,
+    batch: bool = False,
+) -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description=description,
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -42,6 +48,14 @@ def make_arg_parser(description: str, epilog: str) -> argparse.ArgumentParser:
         action="store_true",
         help="Skip overwrite confirmation prompts",
     )
+    if batch:
+        parser.add_argument(
+            "--batch",
+            "-b",
+            nargs="+",
+            metavar="FILE",
+            help="Sanitize each FILE in place, in parallel worker processes",
+        )
     return parser
 
 
@@ -59,7 +73,10 @@ def prompt_overwrite(file_path: Path) -> bool:
 
 
 def read_input_file(file_path: Path) -> str:
-    return file_path.read_text(encoding="utf-8")
+    # One read and one decode; no newline translation.  CRLF input is safe:
+    # the Mermaid parser drops '\r' from frontmatter and body lines, JSON
+    # treats it as whitespace, and the XML parser normalises .gan line ends.
+    return file_path.read_bytes().decode("utf-8")
 
 
 def write_output_file(file_path: Path, content: str) -> None:
@@ -76,16 +93,14 @@ def read_interactive_input(prompt_name: str) -> str:
     print("or Ctrl+D on Unix/Linux, or enter an empty line to finish):")
     print("-" * 40)
 
-    lines = []
-    try:
-        while True:
-            line = input()
-            lines.append(line)
-    except EOFError:
-        pass
+    # One read up to EOF rather than an input() call per pasted line.
+    # Drop the final newline so the result matches the old per-line join.
+    text = sys.stdin.read()
+    if text.endswith("\n"):
+        text = text[:-1]
 
     print("-" * 40)
-    return "\n".join(lines)
+    return text
 
 
 def get_input_text(args: argparse.Namespace, prompt_name: str) -> Optional[str]:
@@ -121,6 +136,55 @@ def get_input_text(args: argparse.Namespace, prompt_name: str) -> Optional[str]:
     return read_input_file(input_path)
 
 
+# =============================================================================
+# Batch mode
+# =============================================================================
+
+def run_batch(
+    args: argparse.Namespace,
+    sanitize_file: Callable[[str, str], tuple[str, Optional[str]]],
+) -> int:
+    """
+    Sanitize every file in args.batch in place.
+
+    sanitize_file(path, line_ending) must be a module-level function (so it
+    can be sent to worker processes) returning (path, error_or_None).
+    Files are independent, so more than one is fanned out over a process pool.
+    """
+    if args.input_file is not None:
+        print("Error: --batch cannot be combined with input/output files.", file=sys.stderr)
+        return 1
+
+    missing = [p for p in args.batch if not check_file_exists(Path(p))]
+    if missing:
+        for p in missing:
+            print(f"Error: Input file '{p}' does not exist.", file=sys.stderr)
+        return 1
+
+    if not args.yes:
+        response = input(f"Overwrite {len(args.batch)} file(s) in place? [y/N]: ")
+        if response.strip().lower() not in ("y", "yes"):
+            print("Cancelled.")
+            return 1
+
+    if len(args.batch) == 1:
+        results = [sanitize_file(args.batch[0], args.line_ending)]
+    else:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(sanitize_file, args.batch, repeat(args.line_ending)))
+
+    failed = 0
+    for path, error in results:
+        if error is None:
+            print(f"Updated file: {path}")
+        else:
+            print(f"Error: {path}: {error}", file=sys.stderr)
+            failed += 1
+
+    print(f"\nSanitized {len(results) - failed} of {len(results)} file(s)")
+    return 0 if failed == 0 else 1
+
+
 # =============================================================================
 # Output routing
 # =============================================================================
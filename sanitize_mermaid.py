@@ -11,12 +11,22 @@ added as converter modules are created.
 """
 
 import sys
+from pathlib import Path
+from typing import Optional
 
 from json_to_python import json_to_python
 from mermaid_to_python import mermaid_to_python
 from python_to_json import python_to_json
 from python_to_mermaid import python_to_mermaid
-from sanitize_common import apply_line_ending, get_input_text, make_arg_parser, write_output
+from sanitize_common import (
+    apply_line_ending,
+    get_input_text,
+    make_arg_parser,
+    read_input_file,
+    run_batch,
+    write_output,
+    write_output_file,
+)
 
 _DESCRIPTION = (
     "Sanitize Mermaid diagrams via a grand round trip "
@@ -39,44 +49,85 @@ Examples:
 
   # Specify Windows-style line endings
   python sanitize_mermaid.py --line-ending crlf diagram.mmd
-"""
-
 
-def main() -> int:
-    args = make_arg_parser(_DESCRIPTION, _EPILOG).parse_args()
+  # Sanitize many files in place, in parallel
+  python sanitize_mermaid.py -y --batch diagrams/*.mmd
+"""
 
-    input_text = get_input_text(args, "Mermaid diagram text")
 
-    if input_text is None:
-        return 1
-
-    if not input_text.strip():
-        print("Error: No input provided.", file=sys.stderr)
-        return 1
-
-    # Grand round trip: mermaid -> python -> json -> python -> mermaid
+def _round_trip(input_text: str) -> tuple[Optional[str], str]:
+    """
+    Grand round trip: mermaid -> python -> json -> python -> mermaid.
 
+    Returns (output_text, diagram_type_name) on success,
+    or (None, error_message) on failure.
+    """
     doc = mermaid_to_python(input_text)
     if doc is None:
-        print("Error: Failed to parse Mermaid diagram.", file=sys.stderr)
-        return 1
+        return None, "Failed to parse Mermaid diagram."
 
     json_text = python_to_json(doc)
     if json_text is None:
-        print("Error: Failed to render JSON.", file=sys.stderr)
-        return 1
+        return None, "Failed to render JSON."
 
     doc2 = json_to_python(json_text)
     if doc2 is None:
-        print("Error: Failed to parse JSON.", file=sys.stderr)
-        return 1
+        return None, "Failed to parse JSON."
 
     output_text = python_to_mermaid(doc2)
     if output_text is None:
-        print("Error: Failed to render Mermaid diagram.", file=sys.stderr)
+        return None, "Failed to render Mermaid diagram."
+
+    return output_text, type(doc2.diagram).__name__
+
+
+def _sanitize_file(path: str, line_ending: str) -> tuple[str, Optional[str]]:
+    """Batch worker: sanitize one file in place. Returns (path, error_or_None)."""
+    try:
+        input_text = read_input_file(Path(path))
+    except (OSError, UnicodeDecodeError) as e:
+        return path, str(e)
+
+    if not input_text.strip():
+        return path, "No input provided."
+
+    # A worker must always return, or executor.map would abort the batch
+    # and lose every other file's report.
+    try:
+        output_text, detail = _round_trip(input_text)
+    except Exception as e:
+        return path, f"{type(e).__name__}: {e}"
+    if output_text is None:
+        return path, detail
+
+    try:
+        write_output_file(Path(path), apply_line_ending(output_text, line_ending))
+    except OSError as e:
+        return path, str(e)
+    return path, None
+
+
+def main() -> int:
+    args = make_arg_parser(_DESCRIPTION, _EPILOG, batch=True).parse_args()
+
+    if args.batch:
+        return run_batch(args, _sanitize_file)
+
+    input_text = get_input_text(args, "Mermaid diagram text")
+
+    if input_text is None:
+        return 1
+
+    if not input_text.strip():
+        print("Error: No input provided.", file=sys.stderr)
+        return 1
+
+    output_text, detail = _round_trip(input_text)
+    if output_text is None:
+        print(f"Error: {detail}", file=sys.stderr)
         return 1
 
-    print(f"Successfully sanitized: {type(doc2.diagram).__name__}")
+    print(f"Successfully sanitized: {detail}")
 
     write_output(apply_line_ending(output_text, args.line_ending), args)
 
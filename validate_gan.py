@@ -17,15 +17,14 @@ Usage:
 
 from __future__ import annotations
 
-import json
 import sys
 from pathlib import Path
 
 from gan_to_python import gan_to_python
-from json_to_python import json_to_python
+from json_to_python import json_to_python_from_dict
 from python_to_gan import python_to_gan
 from python_to_json import python_to_json
-from validate_json import _step_compare, _step_pydantic, _step_round_trip
+from validate_json import _loads, _step_compare, _step_pydantic, _step_round_trip
 
 
 def main() -> None:
@@ -43,9 +42,8 @@ def main() -> None:
 
     def fail(label: str, errors: list[str]) -> None:
         nonlocal failed
-        print(f"  FAIL  {label}")
-        for e in errors:
-            print(f"        {e}")
+        # The step and its error lines go out in one write.
+        print("\n".join([f"  FAIL  {label}"] + [f"        {e}" for e in errors]))
         failed += 1
 
     print(f"Validating {path}\n")
@@ -73,8 +71,8 @@ def main() -> None:
         sys.exit(1)
     ok("JSON render")
 
-    # Parse the rendered JSON into a dict for the remaining steps.
-    data = json.loads(json_text)
+    # Parse the rendered JSON once; validation, round-trip and comparison share it.
+    data = _loads(json_text)
 
     # Step 3: Pydantic validation.
     errs = _step_pydantic(data)
@@ -84,23 +82,22 @@ def main() -> None:
         ok("Pydantic validation")
 
     # Step 4: Round-trip (JSON -> Python -> JSON).
-    rt_json, errs = _step_round_trip(json_text)
+    rt_data, errs = _step_round_trip(data)
     if errs:
         fail("Round-trip conversion", errs)
     else:
         ok("Round-trip conversion  (JSON -> Python -> JSON)")
 
     # Step 5: Comparison.
-    if rt_json is not None:
-        errs = _step_compare(data, rt_json)
+    if rt_data is not None:
+        errs = _step_compare(data, rt_data)
         if errs:
             fail("Round-trip comparison", errs)
         else:
             ok("Round-trip comparison  (output == rendered JSON)")
 
     # Step 6: GAN render (JSON -> Python -> .gan).
-    gan_src = rt_json if rt_json is not None else json_text
-    doc2 = json_to_python(gan_src)
+    doc2 = json_to_python_from_dict(rt_data if rt_data is not None else data)
     if doc2 is None:
         fail("GAN render", ["json_to_python returned None"])
     else:
@@ -4,28 +4,54 @@ validate_json.py
 Validate a diagram AST JSON file through three steps:
 
   1. Pydantic — structural validation: required fields, type coercion,
-     enum membership, ISO 8601 duration format.
+     enum membership, ISO 8601 duration format, no unknown keys.
   2. Round-trip — JSON -> diagram_models Python objects -> JSON.
      Exercises both the json_to_python and python_to_json converters.
   3. Comparison — the round-tripped JSON must equal the original
      (compared as parsed dicts, so key order doesn't matter).
 
+If orjson is installed it is used for JSON parsing; otherwise the stdlib
+json module is used.
+
 Usage:
     python validate_json.py <path/to/file.json>
     python validate_json.py test_json/test_gantt_1.json
+
+Several files or glob patterns validate in batch over worker processes:
+    python validate_json.py "test_json/*.json"
 """
 
 from __future__ import annotations
 
-import difflib
+import glob
+import itertools
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from pathlib import Path
-from typing import Annotated, Literal, Optional, Union
+from typing import Annotated, Iterator, Literal, Optional, TextIO, Union
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
+
+from json_to_python import json_to_python_from_dict
+from python_to_json import python_to_json_dict
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+try:
+    import orjson  # type: ignore
+    _loads = orjson.loads  # raises orjson.JSONDecodeError, a json.JSONDecodeError
+except ImportError:
+    _loads = json.loads
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -75,11 +101,26 @@ class GanttTaskStatus(str, Enum):
     CRIT   = "CRIT"
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Model base
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _Base(BaseModel):
+    """
+    Common config for every AST model.
+
+    extra="forbid": keys not in the schema are validation errors, not
+    silently dropped.
+    frozen=True: validated nodes are read-only.
+    """
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Shared node
 # ─────────────────────────────────────────────────────────────────────────────
 
-class Comment(BaseModel):
+class Comment(_Base):
     kind:             Literal["COMMENT"]
     text:             str
     id:               Optional[str] = None
@@ -90,39 +131,41 @@ class Comment(BaseModel):
 # Date / time value types
 # ─────────────────────────────────────────────────────────────────────────────
 
-class AbsoluteDate(BaseModel):
+class AbsoluteDate(_Base):
     kind:  Literal["ABSOLUTE_DATE"]
     value: str
 
 
-class AbsoluteDateTime(BaseModel):
+class AbsoluteDateTime(_Base):
     kind:  Literal["ABSOLUTE_DATETIME"]
     value: str
 
 
-class TimeOfDay(BaseModel):
+class TimeOfDay(_Base):
     kind:  Literal["TIME_OF_DAY"]
     value: str
 
 
-_ISO_DUR = re.compile(
-    r"^P(?!$)(\d+Y)?(\d+M)?(\d+W)?(\d+D)?(T(?!$)(\d+H)?(\d+M)?(\d+S)?)?$"
-)
+# Bound fullmatch methods: anchoring comes from fullmatch, and validators call
+# them directly without an attribute lookup on the pattern each time.
+_ISO_DUR_FULLMATCH = re.compile(
+    r"P(?!$)(\d+Y)?(\d+M)?(\d+W)?(\d+D)?(T(?!$)(\d+H)?(\d+M)?(\d+S)?)?"
+).fullmatch
 
 # Lag may carry a leading '-' to represent lead time (overlap).
-_ISO_DUR_SIGNED = re.compile(
-    r"^-?P(?!$)(\d+Y)?(\d+M)?(\d+W)?(\d+D)?(T(?!$)(\d+H)?(\d+M)?(\d+S)?)?$"
-)
+_ISO_DUR_SIGNED_FULLMATCH = re.compile(
+    r"-?P(?!$)(\d+Y)?(\d+M)?(\d+W)?(\d+D)?(T(?!$)(\d+H)?(\d+M)?(\d+S)?)?"
+).fullmatch
 
 
-class RelativeDuration(BaseModel):
+class RelativeDuration(_Base):
     kind:  Literal["RELATIVE_DURATION"]
     value: str
 
     @field_validator("value")
     @classmethod
     def validate_iso_duration(cls, v: str) -> str:
-        if not _ISO_DUR.match(v):
+        if _ISO_DUR_FULLMATCH(v) is None:
             raise ValueError(f"Not a valid ISO 8601 duration: {v!r}")
         return v
 
@@ -131,11 +174,11 @@ class RelativeDuration(BaseModel):
 # Implicit markers
 # ─────────────────────────────────────────────────────────────────────────────
 
-class ImplicitStart(BaseModel):
+class ImplicitStart(_Base):
     kind: Literal["IMPLICIT_START"]
 
 
-class ImplicitEnd(BaseModel):
+class ImplicitEnd(_Base):
     kind: Literal["IMPLICIT_END"]
 
 
@@ -143,7 +186,7 @@ class ImplicitEnd(BaseModel):
 # Constraint reference
 # ─────────────────────────────────────────────────────────────────────────────
 
-class ConstraintRef(BaseModel):
+class ConstraintRef(_Base):
     kind:            Literal["CONSTRAINT_REF"]
     task_ids:        list[str]
     dependency_type: DependencyType
@@ -159,7 +202,7 @@ class ConstraintRef(BaseModel):
     @field_validator("lag")
     @classmethod
     def validate_lag(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None and not _ISO_DUR_SIGNED.match(v):
+        if v is not None and _ISO_DUR_SIGNED_FULLMATCH(v) is None:
             raise ValueError(f"lag must be a signed ISO 8601 duration, got {v!r}")
         return v
 
@@ -183,7 +226,7 @@ EndCondition = Annotated[
 # Gantt preamble
 # ─────────────────────────────────────────────────────────────────────────────
 
-class GanttDirective(BaseModel):
+class GanttDirective(_Base):
     kind:  Literal["GANTT_DIRECTIVE"]
     name:  GanttDirectiveName
     value: str
@@ -199,7 +242,7 @@ GanttHeaderElement = Annotated[
 # Gantt body elements
 # ─────────────────────────────────────────────────────────────────────────────
 
-class GanttTask(BaseModel):
+class GanttTask(_Base):
     kind:             Literal["GANTT_TASK"]
     name:             str
     element_type:     GanttElementType
@@ -215,7 +258,7 @@ class GanttTask(BaseModel):
     @field_validator("duration")
     @classmethod
     def validate_duration(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None and not _ISO_DUR.match(v):
+        if v is not None and _ISO_DUR_FULLMATCH(v) is None:
             raise ValueError(f"Not a valid ISO 8601 duration: {v!r}")
         return v
 
@@ -226,7 +269,7 @@ GanttSectionElement = Annotated[
 ]
 
 
-class GanttSection(BaseModel):
+class GanttSection(_Base):
     kind:             Literal["GANTT_SECTION"]
     name:             str
     elements:         list[GanttSectionElement]
@@ -244,7 +287,7 @@ GanttTopLevelElement = Annotated[
 # Gantt diagram
 # ─────────────────────────────────────────────────────────────────────────────
 
-class GanttDiagram(BaseModel):
+class GanttDiagram(_Base):
     kind:             Literal["GANTT_DIAGRAM"]
     header:           list[GanttHeaderElement]
     elements:         list[GanttTopLevelElement]
@@ -257,7 +300,7 @@ class GanttDiagram(BaseModel):
 # Extend diagram union here as new diagram types are implemented.
 # ─────────────────────────────────────────────────────────────────────────────
 
-class GanttProjectMetadata(BaseModel):
+class GanttProjectMetadata(_Base):
     kind:         Literal["GANTT_PROJECT_METADATA"]
     name:         Optional[str] = None
     locale:       Optional[str] = None
@@ -265,132 +308,247 @@ class GanttProjectMetadata(BaseModel):
     working_days: list[DayOfWeek] = []
 
 
-class Document(BaseModel):
+class Document(_Base):
     version:      Optional[str] = None
     frontmatter:  Optional[str] = None
     diagram:      GanttDiagram  # Union[GanttDiagram, ...] when more types exist
     ganttproject: Optional[GanttProjectMetadata] = None
 
 
+# Built once at import and reused for every document validated in-process.
+_DOC_ADAPTER = TypeAdapter(Document)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Validation steps
 # ─────────────────────────────────────────────────────────────────────────────
 
 def _step_pydantic(data: dict) -> list[str]:
-    """Pydantic structural validation. Returns list of error strings (empty = pass)."""
+    """
+    Pydantic structural validation of the parsed JSON.
+    Takes the dict the caller already parsed for the round-trip steps, so
+    the text is parsed once per file.
+    Returns list of error strings (empty = pass).
+    """
     try:
-        Document.model_validate(data)
+        _DOC_ADAPTER.validate_python(data)
         return []
-    except Exception as exc:
-        return str(exc).splitlines()
+    except ValidationError as exc:
+        # Structured errors straight from pydantic-core; skips building the
+        # full pretty-printed message only to split it back into lines.
+        errors = exc.errors(include_url=False, include_context=False)
+        return [f"{len(errors)} validation error(s) for {exc.title}"] + [
+            f"{'.'.join(map(str, e['loc'])) or '<root>'}: {e['msg']}"
+            for e in errors
+        ]
 
 
-def _step_round_trip(json_text: str) -> tuple[Optional[str], list[str]]:
+def _step_round_trip(data: dict) -> tuple[Optional[dict], list[str]]:
     """
-    JSON -> Python objects -> JSON.
-    Returns (round_tripped_json_or_None, error_lines).
+    JSON -> Python objects -> JSON, starting from the already-parsed JSON.
+    Returns (round_tripped_dict_or_None, error_lines).
+
+    The dict is the renderer's own output and is compared without a
+    serialise/re-parse, so this relies on the renderers emitting only
+    JSON-native values (dict, list, str, int, float, bool, None).  A tuple
+    or other non-JSON type would show up as a mismatch here; serialisability
+    itself is exercised by python_to_json in the sanitizers.
     """
-    from json_to_python import json_to_python
-    from python_to_json import python_to_json
-
-    py_doc = json_to_python(json_text)
+    py_doc = json_to_python_from_dict(data)
     if py_doc is None:
         return None, ["json_to_python returned None (unsupported or malformed)"]
 
-    rt_json = python_to_json(py_doc)
-    if rt_json is None:
+    rt_data = python_to_json_dict(py_doc)
+    if rt_data is None:
         return None, ["python_to_json returned None (no renderer available)"]
 
-    return rt_json, []
+    return rt_data, []
+
+
+# Most difference lines _step_compare reports before truncating.
+_MAX_DIFF_LINES = 50
 
 
-def _step_compare(original: dict, rt_json: str) -> list[str]:
+def _summarize(value) -> str:
+    """Short description of a JSON value for a diff line; never the whole subtree."""
+    if isinstance(value, dict):
+        return f"object with {len(value)} key(s)"
+    if isinstance(value, list):
+        return f"list of {len(value)} item(s)"
+    text = repr(value)
+    return text if len(text) <= 60 else text[:57] + "..."
+
+
+def _dict_diff(a, b, path: str = "$") -> Iterator[str]:
+    """
+    Walk two parsed JSON values side by side and yield one line per
+    difference, addressed by a JSONPath-style location ($.diagram.elements[3].id).
+    Lazy, so callers only pay for the differences they actually print.
+    """
+    if isinstance(a, dict) and isinstance(b, dict):
+        for key in sorted(a.keys() | b.keys()):
+            sub = f"{path}.{key}"
+            if key not in b:
+                yield f"{sub}: missing from round-trip (expected {_summarize(a[key])})"
+            elif key not in a:
+                yield f"{sub}: unexpected in round-trip (got {_summarize(b[key])})"
+            else:
+                yield from _dict_diff(a[key], b[key], sub)
+    elif isinstance(a, list) and isinstance(b, list):
+        for i, (x, y) in enumerate(zip(a, b)):
+            yield from _dict_diff(x, y, f"{path}[{i}]")
+        if len(a) != len(b):
+            yield f"{path}: expected {len(a)} item(s), got {len(b)}"
+    elif a != b:
+        yield f"{path}: expected {_summarize(a)}, got {_summarize(b)}"
+
+
+def _step_compare(original: dict, rt_data: dict) -> list[str]:
     """
-    Compare original dict to round-tripped JSON (parsed as dict).
+    Compare original dict to the round-tripped dict.
     Returns list of error strings (empty = pass).
     """
-    try:
-        rt_data = json.loads(rt_json)
-    except json.JSONDecodeError as e:
-        return [f"Round-tripped output is not valid JSON: {e}"]
-
     if original == rt_data:
         return []
 
-    # Produce a readable diff on pretty-printed forms.
-    orig_lines = json.dumps(original, indent=2, sort_keys=True).splitlines(keepends=True)
-    rt_lines   = json.dumps(rt_data,  indent=2, sort_keys=True).splitlines(keepends=True)
-    diff = list(difflib.unified_diff(orig_lines, rt_lines, fromfile="original", tofile="round-trip", n=3))
-    if diff:
-        return ["Round-tripped JSON differs from original:"] + [l.rstrip("\n") for l in diff]
-    return ["Round-trip mismatch (dicts differ but pretty-printed forms are identical)"]
+    # Only reached on a mismatch: report the differing paths, capped so a
+    # badly broken round-trip cannot flood the output.
+    diff = _dict_diff(original, rt_data)
+    lines = list(itertools.islice(diff, _MAX_DIFF_LINES))
+    if next(diff, None) is not None:
+        lines.append("... (truncated)")
+    return ["Round-tripped JSON differs from original:"] + lines
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Main
 # ─────────────────────────────────────────────────────────────────────────────
 
-def main() -> None:
-    if len(sys.argv) < 2:
-        print("Usage: python validate_json.py <path/to/file.json>")
-        sys.exit(1)
-
-    path = Path(sys.argv[1])
+def _validate_one(path: Path, stream: Optional[TextIO] = None) -> tuple[str, bool]:
+    """
+    Run every validation step on one file.
+    Returns (report_text, all_passed); module-level so batch mode can run it
+    in worker processes.  If stream is given, each step's lines are also
+    written to it as soon as the step finishes, so they keep their place
+    among any converter warnings on stderr.
+    """
     passed = failed = 0
+    lines: list[str] = []
+
+    def emit(text: str) -> None:
+        lines.append(text)
+        if stream is not None:
+            stream.write(text + "\n")
 
     def ok(label: str) -> None:
         nonlocal passed
-        print(f"  PASS  {label}")
+        emit(f"  PASS  {label}")
         passed += 1
 
     def fail(label: str, errors: list[str]) -> None:
         nonlocal failed
-        print(f"  FAIL  {label}")
-        for e in errors:
-            print(f"        {e}")
+        # The step and its error lines go out in one write.
+        emit("\n".join([f"  FAIL  {label}"] + [f"        {e}" for e in errors]))
         failed += 1
 
-    print(f"Validating {path}\n")
+    emit(f"Validating {path}\n")
 
-    # Load the file.
+    # Load the file as raw bytes; the JSON parser decodes UTF-8 itself, so
+    # no str copy is made here.
     try:
-        json_text = path.read_text(encoding="utf-8")
+        json_bytes = path.read_bytes()
     except OSError as e:
-        print(f"Error: {e}")
-        sys.exit(1)
+        emit(f"Error: {e}")
+        return "\n".join(lines), False
 
     try:
-        data = json.loads(json_text)
-    except json.JSONDecodeError as e:
-        print(f"  FAIL  JSON parse\n        {e}")
-        sys.exit(1)
+        data = _loads(json_bytes)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        fail("JSON parse", [str(e)])
+        return "\n".join(lines), False
 
     ok("JSON parse")
 
-    # Step 1: Pydantic validation.
-    errs = _step_pydantic(data)
-    if errs:
-        fail("Pydantic validation", errs)
-    else:
-        ok("Pydantic validation")
-
-    # Step 2: Round-trip conversion.
-    rt_json, errs = _step_round_trip(json_text)
-    if errs:
-        fail("Round-trip conversion", errs)
-    else:
-        ok("Round-trip conversion  (JSON -> Python -> JSON)")
-
-    # Step 3: Comparison (only if round-trip succeeded).
-    if rt_json is not None:
-        errs = _step_compare(data, rt_json)
+    # Anything unexpected is reported as a failed step rather than raised,
+    # so one bad file cannot abort a batch or discard the steps already run.
+    try:
+        # Step 1: Pydantic validation.
+        errs = _step_pydantic(data)
+        if errs:
+            fail("Pydantic validation", errs)
+        else:
+            ok("Pydantic validation")
+
+        # Step 2: Round-trip conversion.
+        rt_data, errs = _step_round_trip(data)
         if errs:
-            fail("Round-trip comparison", errs)
+            fail("Round-trip conversion", errs)
         else:
-            ok("Round-trip comparison  (output == original)")
+            ok("Round-trip conversion  (JSON -> Python -> JSON)")
+
+        # Step 3: Comparison (only if round-trip succeeded).
+        if rt_data is not None:
+            errs = _step_compare(data, rt_data)
+            if errs:
+                fail("Round-trip comparison", errs)
+            else:
+                ok("Round-trip comparison  (output == original)")
+    except Exception as e:
+        fail("Unexpected error", [f"{type(e).__name__}: {e}"])
+
+    emit(f"\nResults: {passed} passed, {failed} failed")
+    return "\n".join(lines), failed == 0
+
+
+def _expand_paths(args: list[str]) -> list[Path]:
+    """
+    Expand glob patterns ourselves so quoted patterns work on every shell
+    (cmd.exe does no expansion).  An argument naming an existing path is
+    taken as-is, so names like case[1].json are not read as patterns; a
+    pattern with no matches is kept as a literal path and reported as
+    unreadable.
+    """
+    paths: list[Path] = []
+    for arg in args:
+        if Path(arg).exists():
+            paths.append(Path(arg))
+            continue
+        matches = sorted(glob.glob(arg)) or [arg]
+        paths.extend(Path(m) for m in matches)
+    return paths
+
+
+def main_batch(paths: list[Path]) -> int:
+    """
+    Validate many files over a process pool.  Each worker imports this
+    module (and builds _DOC_ADAPTER) once, then handles its share of files.
+    Reports are written in input order as they complete.
+    """
+    failed = 0
+    workers = os.cpu_count() or 1
+    # A few chunks per worker: large enough to amortise the hand-off, small
+    # enough that short runs still spread across every worker.
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for report, all_passed in executor.map(_validate_one, paths, chunksize=chunksize):
+            sys.stdout.write(report + "\n\n")
+            failed += not all_passed
+
+    sys.stdout.write(f"Files: {len(paths) - failed} passed, {failed} failed\n")
+    return 0 if failed == 0 else 1
+
+
+def main() -> None:
+    if len(sys.argv) < 2:
+        print("Usage: python validate_json.py <path/to/file.json> [more files or globs ...]")
+        sys.exit(1)
+
+    paths = _expand_paths(sys.argv[1:])
+    if len(paths) > 1:
+        sys.exit(main_batch(paths))
 
-    print(f"\nResults: {passed} passed, {failed} failed")
-    sys.exit(0 if failed == 0 else 1)
+    _, all_passed = _validate_one(paths[0], sys.stdout)
+    sys.exit(0 if all_passed else 1)
 
 
 if __name__ == "__main__":
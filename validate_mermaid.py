@@ -16,13 +16,12 @@ Usage:
 
 from __future__ import annotations
 
-import json
 import sys
 from pathlib import Path
 
 from mermaid_to_python import mermaid_to_python
 from python_to_json import python_to_json
-from validate_json import _step_compare, _step_pydantic, _step_round_trip
+from validate_json import _loads, _step_compare, _step_pydantic, _step_round_trip
 
 
 def main() -> None:
@@ -40,9 +39,8 @@ def main() -> None:
 
     def fail(label: str, errors: list[str]) -> None:
         nonlocal failed
-        print(f"  FAIL  {label}")
-        for e in errors:
-            print(f"        {e}")
+        # The step and its error lines go out in one write.
+        print("\n".join([f"  FAIL  {label}"] + [f"        {e}" for e in errors]))
         failed += 1
 
     print(f"Validating {path}\n")
@@ -70,8 +68,8 @@ def main() -> None:
         sys.exit(1)
     ok("JSON render")
 
-    # Parse the rendered JSON into a dict for the remaining steps.
-    data = json.loads(json_text)
+    # Parse the rendered JSON once; validation, round-trip and comparison share it.
+    data = _loads(json_text)
 
     # Step 3: Pydantic validation.
     errs = _step_pydantic(data)
@@ -81,15 +79,15 @@ def main() -> None:
         ok("Pydantic validation")
 
     # Step 4: Round-trip (JSON -> Python -> JSON).
-    rt_json, errs = _step_round_trip(json_text)
+    rt_data, errs = _step_round_trip(data)
     if errs:
         fail("Round-trip conversion", errs)
     else:
         ok("Round-trip conversion  (JSON -> Python -> JSON)")
 
     # Step 5: Comparison.
-    if rt_json is not None:
-        errs = _step_compare(data, rt_json)
+    if rt_data is not None:
+        errs = _step_compare(data, rt_data)
         if errs:
             fail("Round-trip comparison", errs)
         else:
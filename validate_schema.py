@@ -5,7 +5,10 @@ Validates schema/schema.graphql structurally, then checks that the
 diagram_models Python package is consistent with it.
 
 No external dependencies are required for the structural checks.
-If graphql-core is installed it is used for deeper SDL validation.
+If graphql-core is installed, its parser replaces the lightweight SDL
+parser and the same AST is used for deeper SDL validation.  On an SDL
+syntax error the lightweight parser is used instead, the error is reported
+by the deep check, and the remaining checks still run.
 
 Usage:
     python validate_schema.py
@@ -18,6 +21,7 @@ Optional deeper validation:
 from __future__ import annotations
 
 import dataclasses
+import functools
 import inspect
 import re
 import sys
@@ -25,6 +29,11 @@ from enum import Enum
 from pathlib import Path
 from typing import Union, get_args, get_origin
 
+try:
+    import graphql  # type: ignore
+except ImportError:
+    graphql = None
+
 SCHEMA_FILE = Path(__file__).parent / "schema" / "schema.graphql"
 BUILTIN_SCALARS = {"String", "Int", "Float", "Boolean", "ID"}
 
@@ -32,10 +41,32 @@ BUILTIN_SCALARS = {"String", "Int", "Float", "Boolean", "ID"}
 # Lightweight SDL parser
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Docstrings and line comments, removed in a single left-to-right pass.
+_SDL_NOISE_RE = re.compile(r'""".*?"""|#[^\n]*', re.DOTALL)
+
+# Every top-level declaration the parser cares about, in one alternation so
+# the SDL is scanned once.  Unions stop at the next top-level keyword.
+_SDL_DECL_RE = re.compile(
+    r'\bscalar\s+(?P<scalar>\w+)'
+    r'|\bunion\s+(?P<union>\w+)\s*=(?P<members>.*?)'
+    r'(?=\b(?:type|interface|enum|union|scalar)\b|$)'
+    r'|\b(?P<keyword>type|interface|enum)\s+(?P<name>\w+)(?P<heading>[^{]*)\{',
+    re.DOTALL,
+)
+
+# "type X implements A & B {" — the heading between the name and the brace.
+_IMPLEMENTS_RE = re.compile(r'\s*implements\s+([\w\s&]+?)\s*$')
+
+# Per-declaration patterns, run on each union right-hand side, body or heading.
+_UNION_MEMBER_RE = re.compile(r'\b[A-Z]\w*\b')
+_FIELD_NAME_RE   = re.compile(r'^\s*(\w+)\s*(?:\([^)]*\))?\s*:', re.MULTILINE)
+_ENUM_VAL_RE     = re.compile(r'^\s*([A-Z_]+)\s*$', re.MULTILINE)
+_WORD_RE         = re.compile(r'\w+')
+
+
 def _strip_sdl(sdl: str) -> str:
     """Remove triple-quoted docstrings and line comments."""
-    sdl = re.sub(r'""".*?"""', '', sdl, flags=re.DOTALL)
-    return re.sub(r'#[^\n]*', '', sdl)
+    return _SDL_NOISE_RE.sub('', sdl)
 
 
 def _parse_sdl(sdl: str) -> dict:
@@ -44,62 +75,107 @@ def _parse_sdl(sdl: str) -> dict:
       types      : {name: [field_name, ...]}   object types only
       interfaces : {name: [field_name, ...]}
       enums      : {name: [value, ...]}
-      unions     : {name: [member_name, ...]}
+      unions     : {name: frozenset of member names}
       scalars    : set of names
+      implements : {type_name: [interface_name, ...]}
+      defined    : set of every type name the SDL defines, plus built-ins
     """
     clean = _strip_sdl(sdl)
     result: dict = {
-        "types": {}, "interfaces": {}, "enums": {}, "unions": {}, "scalars": set()
+        "types": {}, "interfaces": {}, "enums": {}, "unions": {}, "scalars": set(),
+        "implements": {},
     }
 
-    # ── scalars ──────────────────────────────────────────────────────────────
-    for m in re.finditer(r'\bscalar\s+(\w+)', clean):
-        result["scalars"].add(m.group(1))
+    for m in _SDL_DECL_RE.finditer(clean):
+        # ── scalars ──────────────────────────────────────────────────────────
+        if m.group("scalar") is not None:
+            result["scalars"].add(m.group("scalar"))
+            continue
 
-    # ── unions ───────────────────────────────────────────────────────────────
-    # Stop at the next top-level keyword.
-    union_re = re.compile(
-        r'\bunion\s+(\w+)\s*=(.*?)(?=\b(?:type|interface|enum|union|scalar)\b|$)',
-        re.DOTALL,
-    )
-    for m in union_re.finditer(clean):
-        name, rhs = m.group(1), m.group(2)
-        # Members are CamelCase identifiers; strip | separators.
-        members = re.findall(r'\b([A-Z]\w*)\b', rhs)
-        result["unions"][name] = members
-
-    # ── types and interfaces ──────────────────────────────────────────────────
-    # Collect { body } blocks for each keyword-name declaration.
-    decl_re = re.compile(r'\b(type|interface|enum)\s+(\w+)[^{]*\{')
-    pos = 0
-    for m in decl_re.finditer(clean):
-        keyword, name = m.group(1), m.group(2)
+        # ── unions ───────────────────────────────────────────────────────────
+        if m.group("union") is not None:
+            # Members are CamelCase identifiers; strip | separators.
+            members = _UNION_MEMBER_RE.findall(m.group("members"))
+            result["unions"][m.group("union")] = frozenset(members)
+            continue
+
+        # ── types, interfaces and enums ──────────────────────────────────────
+        keyword, name, heading = m.group("keyword", "name", "heading")
         brace_open = m.end() - 1  # points at the opening {
-        # Walk to the matching closing brace.
-        depth, i = 0, brace_open
-        while i < len(clean):
-            if clean[i] == '{':
+        # Step brace to brace to the matching closing one.  Docstrings are
+        # already stripped, so every brace left in the text is structural.
+        depth, i = 1, brace_open + 1
+        while depth:
+            next_open = clean.find('{', i)
+            next_close = clean.find('}', i)
+            if next_close == -1:
+                break
+            if 0 <= next_open < next_close:
                 depth += 1
-            elif clean[i] == '}':
+                i = next_open + 1
+            else:
                 depth -= 1
-                if depth == 0:
-                    body = clean[brace_open + 1:i]
-                    break
-            i += 1
-        else:
+                i = next_close + 1
+        if depth:
             continue  # unclosed brace — skip
+        body = clean[brace_open + 1:i - 1]
 
         if keyword in ('type', 'interface'):
-            field_names = re.findall(r'^\s*(\w+)\s*(?:\([^)]*\))?\s*:', body, re.MULTILINE)
+            field_names = _FIELD_NAME_RE.findall(body)
             if keyword == 'type':
                 result["types"][name] = field_names
+                # Record the interface names from the declaration heading.
+                impl = _IMPLEMENTS_RE.match(heading)
+                if impl:
+                    result["implements"][name] = _WORD_RE.findall(impl.group(1))
             else:
                 result["interfaces"][name] = field_names
         elif keyword == 'enum':
             # Enum values are ALL_CAPS identifiers on their own line.
-            values = re.findall(r'^\s*([A-Z_]+)\s*$', body, re.MULTILINE)
+            values = _ENUM_VAL_RE.findall(body)
             result["enums"][name] = values
 
+    result["defined"] = _all_defined(result)
+    return result
+
+
+# graphql-core definition node kinds that _parse_sdl_ast extracts.
+_AST_KINDS = {
+    "object_type_definition",
+    "interface_type_definition",
+    "enum_type_definition",
+    "union_type_definition",
+    "scalar_type_definition",
+}
+
+
+def _parse_sdl_ast(document) -> dict:
+    """
+    Same result as _parse_sdl, built in one walk over a graphql-core
+    DocumentNode instead of regex passes over the SDL text.
+    """
+    result: dict = {
+        "types": {}, "interfaces": {}, "enums": {}, "unions": {}, "scalars": set(),
+        "implements": {},
+    }
+    for node in document.definitions:
+        kind = node.kind
+        if kind not in _AST_KINDS:
+            continue
+        name = node.name.value
+        if kind == "object_type_definition":
+            result["types"][name] = [f.name.value for f in node.fields or ()]
+            if node.interfaces:
+                result["implements"][name] = [i.name.value for i in node.interfaces]
+        elif kind == "interface_type_definition":
+            result["interfaces"][name] = [f.name.value for f in node.fields or ()]
+        elif kind == "enum_type_definition":
+            result["enums"][name] = [v.name.value for v in node.values or ()]
+        elif kind == "union_type_definition":
+            result["unions"][name] = frozenset(t.name.value for t in node.types or ())
+        else:  # scalar_type_definition
+            result["scalars"].add(name)
+    result["defined"] = _all_defined(result)
     return result
 
 
@@ -120,23 +196,17 @@ def _all_defined(parsed: dict) -> set[str]:
 
 def check_schema_structure(parsed: dict) -> list[str]:
     errors: list[str] = []
-    defined = _all_defined(parsed)
+    defined = parsed["defined"]
 
     # Union members must reference defined types.
     for union_name, members in parsed["unions"].items():
-        for member in members:
-            if member not in defined:
-                errors.append(
-                    f"Union {union_name!r}: member '{member}' is not defined"
-                )
+        for member in sorted(members - defined):
+            errors.append(
+                f"Union {union_name!r}: member '{member}' is not defined"
+            )
 
     # Interface fields must be present on all implementing types.
-    # Detect implementations from the SDL: "type X implements A & B".
-    clean = _strip_sdl(SCHEMA_FILE.read_text(encoding="utf-8"))
-    impl_re = re.compile(r'\btype\s+(\w+)\s+implements\s+([\w\s&]+?)\s*\{')
-    for m in impl_re.finditer(clean):
-        type_name = m.group(1)
-        ifaces = re.findall(r'\w+', m.group(2).replace('&', ' '))
+    for type_name, ifaces in parsed["implements"].items():
         type_fields = set(parsed["types"].get(type_name, []))
         for iface in ifaces:
             for required in parsed["interfaces"].get(iface, []):
@@ -153,10 +223,13 @@ def check_schema_structure(parsed: dict) -> list[str]:
 # Collect Python model types from diagram_models
 # ─────────────────────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
 def collect_models() -> tuple[dict, dict, dict, dict]:
     """
     Returns (dataclasses_map, enums_map, unions_map, all_vars).
+    The modules are scanned once; later calls return the cached maps.
 
+    unions_map holds each Union alias as a frozenset of member class names.
     all_vars is a flat name→object dict across all modules, used for
     detecting single-member unions that Python collapses to a plain class.
     """
@@ -174,12 +247,15 @@ def collect_models() -> tuple[dict, dict, dict, dict]:
             if name.startswith('_'):
                 continue
             all_vars[name] = obj
-            if inspect.isclass(obj) and dataclasses.is_dataclass(obj):
-                dataclasses_map[name] = obj
-            elif inspect.isclass(obj) and issubclass(obj, Enum) and obj is not Enum:
-                enums_map[name] = obj
-            elif get_origin(obj) is Union:
-                unions_map[name] = obj
+            # Union aliases are not classes, so test for them first; everything
+            # else of interest is a class, checked once.
+            if get_origin(obj) is Union:
+                unions_map[name] = frozenset(cls.__name__ for cls in get_args(obj))
+            elif isinstance(obj, type):
+                if dataclasses.is_dataclass(obj):
+                    dataclasses_map[name] = obj
+                elif issubclass(obj, Enum) and obj is not Enum:
+                    enums_map[name] = obj
 
     return dataclasses_map, enums_map, unions_map, all_vars
 
@@ -212,11 +288,10 @@ def check_kind_discriminators(parsed: dict, dataclasses_map: dict) -> list[str]:
                     )
 
     # Reverse: ElementKind → dataclass
-    for val in element_kind_values:
-        if val not in kind_defaults:
-            errors.append(
-                f"ElementKind.{val} has no corresponding Python dataclass"
-            )
+    for val in sorted(element_kind_values - kind_defaults):
+        errors.append(
+            f"ElementKind.{val} has no corresponding Python dataclass"
+        )
 
     return errors
 
@@ -253,12 +328,11 @@ def check_object_fields(parsed: dict, dataclasses_map: dict) -> list[str]:
         if py_cls is None:
             continue
         py_field_names = {f.name for f in dataclasses.fields(py_cls)}
-        for field_name in schema_fields:
-            if field_name not in py_field_names:
-                errors.append(
-                    f"{type_name}: schema field '{field_name}' "
-                    f"not found on Python dataclass"
-                )
+        for field_name in sorted(set(schema_fields) - py_field_names):
+            errors.append(
+                f"{type_name}: schema field '{field_name}' "
+                f"not found on Python dataclass"
+            )
     return errors
 
 
@@ -269,20 +343,14 @@ def check_union_members(parsed: dict, unions_map: dict, all_vars: dict) -> list[
     of member type names must match.
     """
     errors: list[str] = []
-    for union_name, schema_members in parsed["unions"].items():
-        schema_set = set(schema_members)
-
-        py_value = all_vars.get(union_name)
-        if py_value is None:
-            continue
-
-        if get_origin(py_value) is Union:
-            python_set = {cls.__name__ for cls in get_args(py_value)}
-        elif inspect.isclass(py_value):
+    for union_name, schema_set in parsed["unions"].items():
+        python_set = unions_map.get(union_name)
+        if python_set is None:
+            py_value = all_vars.get(union_name)
+            if not inspect.isclass(py_value):
+                continue
             # Single-member union collapsed to a plain class by Python's typing.
             python_set = {py_value.__name__}
-        else:
-            continue
 
         for m in sorted(schema_set - python_set):
             errors.append(f"{union_name}: schema member '{m}' not in Python Union")
@@ -306,9 +374,8 @@ def main() -> None:
 
     def fail(label: str, errors: list[str]) -> None:
         nonlocal failed
-        print(f"  FAIL  {label}")
-        for e in errors:
-            print(f"        {e}")
+        # The step and its error lines go out in one write.
+        print("\n".join([f"  FAIL  {label}"] + [f"        {e}" for e in errors]))
         failed += 1
 
     # ── Section 1: Schema structural validation ───────────────────────────────
@@ -321,8 +388,22 @@ def main() -> None:
         fail("schema file readable", [str(e)])
         sys.exit(1)
 
+    # With graphql-core the SDL is parsed once; the AST feeds both the
+    # structural extraction and the deep validation below.  A syntax error
+    # falls back to the lightweight parser and is reported by the deep check,
+    # so the remaining checks still run.
+    document = None
+    syntax_error = None
+    if graphql is not None:
+        try:
+            document = graphql.parse(sdl)
+        except graphql.GraphQLSyntaxError as e:
+            syntax_error = e
     try:
-        parsed = _parse_sdl(sdl)
+        if document is not None:
+            parsed = _parse_sdl_ast(document)
+        else:
+            parsed = _parse_sdl(sdl)
         ok(
             f"SDL parsed  "
             f"({len(parsed['types'])} types, "
@@ -332,18 +413,19 @@ def main() -> None:
             f"{len(parsed['scalars'])} scalars)"
         )
     except Exception as e:
-        fail("SDL parsed", [str(e)])
+        fail("SDL parsed", str(e).splitlines())
         sys.exit(1)
 
     # Optional: graphql-core deep validation
-    try:
-        from graphql import assert_valid_schema, build_schema  # type: ignore
+    if syntax_error is not None:
+        fail("GraphQL SDL valid (graphql-core)", str(syntax_error).splitlines())
+    elif document is not None:
         try:
-            assert_valid_schema(build_schema(sdl))
+            graphql.assert_valid_schema(graphql.build_ast_schema(document))
             ok("GraphQL SDL valid (graphql-core)")
         except Exception as e:
             fail("GraphQL SDL valid (graphql-core)", str(e).splitlines())
-    except ImportError:
+    else:
         print("  NOTE  graphql-core not installed — skipping deep SDL check")
         print("        pip install graphql-core  for full type-reference validation")
 